@@ -1,66 +1,172 @@
+import gc
+import multiprocessing
+import os
+import re
+import tempfile
 import time
-import matplotlib.pyplot as plt
-import csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+import numpy as np
 from data_structures.b_tree import BTree
 from data_structures.red_black_tree import RedBlackTree
 from data_structures.xor_linked_list import XORLinkedList
+from data_structures.doubly_linked_list import DoublyLinkedList
 from data_structures.dataset_generator import DatasetGenerator
 
-def benchmark_data_structures(data_structure, dataset):
-    """Test insertion, search, and deletion operations in sequence."""
+try:
+    from data_structures.numba_b_tree import NumbaBTree
+    from data_structures.numba_red_black_tree import NumbaRedBlackTree
+except ImportError:  # numba is unavailable, e.g. when running under PyPy
+    NumbaBTree = NumbaRedBlackTree = None
+
+OPERATIONS = [
+    'insertion', 'search', 'deletion', 'deletion (no rebalance)',
+    'bulk insertion', 'batch insertion'
+]
+
+# Structures that take the dataset array as is instead of Python ints
+ARRAY_STRUCTURES = (NumbaBTree, NumbaRedBlackTree) if NumbaBTree else ()
+
+# Structures addressed by position rather than by value
+LIST_STRUCTURES = (XORLinkedList, DoublyLinkedList)
+
+STRUCTURES = {
+    'B-Tree': lambda: BTree(16),
+    'Red-Black Tree': lambda: RedBlackTree(),
+    'XOR Linked List': lambda: XORLinkedList(),
+    'Doubly Linked List': lambda: DoublyLinkedList()
+}
+if NumbaBTree:
+    STRUCTURES['B-Tree (Numba)'] = lambda: NumbaBTree(16)
+    STRUCTURES['Red-Black Tree (Numba)'] = lambda: NumbaRedBlackTree()
+
+@contextmanager
+def gc_paused():
+    """Keep the cyclic garbage collector from pausing inside a timed block.
+    
+    Garbage left over by the block is collected on exit, after the caller
+    has taken its end timestamp.
+    """
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.collect()
+        gc.enable()
+
+def benchmark_data_structures(data_structure, dataset, delete_order):
+    """Test insertion, search, and deletion operations in sequence.
+    
+    The sequences are only iterated, never copied, so callers can share
+    them between structures.
+    
+    Args:
+        data_structure: Empty structure to benchmark
+        dataset (list or numpy.ndarray): Values to insert and search for
+        delete_order (list or numpy.ndarray): Values in the order they are deleted
+    """
     results = {'insertion': 0, 'search': 0, 'deletion': 0}
     
-    # Convert dataset to list to avoid any iterator issues
-    dataset = list(dataset)
+    # Pick each operation once so the timed loops don't re-check the type
+    if isinstance(data_structure, LIST_STRUCTURES):
+        # Lists are positional: insert, read and delete at the beginning
+        insert_op = partial(data_structure.insert, position=0)
+        read_op = lambda value: data_structure.read(0)
+        delete_op = lambda value: data_structure.delete(0)
+    else:
+        # Trees work by value
+        insert_op = data_structure.insert
+        read_op = data_structure.read
+        delete_op = data_structure.delete
     
-    # Test insertion
+    # Test insertion. Structures that can preallocate their nodes do so
+    # inside the timed block, since every other structure pays for node
+    # allocation in its insert loop.
     print("  Testing insertion...")
-    start_time = time.time()
-    for value in dataset:
-        if isinstance(data_structure, XORLinkedList):
-            data_structure.insert(value, position=0)  # Insert at beginning for XOR list
-        else:
-            data_structure.insert(value)
-    results['insertion'] = time.time() - start_time
+    reserve = getattr(data_structure, 'reserve', None)
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        if reserve is not None:
+            reserve(len(dataset))
+        for value in dataset:
+            insert_op(value)
+        results['insertion'] = (time.perf_counter_ns() - start_time) / 1e9
     print(f"  Insertion: {results['insertion']:.2f} seconds")
     
     # Test search (now that values are in the structure)
     print("  Testing search...")
-    start_time = time.time()
-    for value in dataset:
-        try:
-            if isinstance(data_structure, XORLinkedList):
-                data_structure.read(0)  # Read from beginning for XOR list
-            else:
-                data_structure.read(value)  # Search by value for trees
-        except (ValueError, IndexError):
-            continue  # Skip if value not found
-    results['search'] = time.time() - start_time
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        for value in dataset:
+            try:
+                read_op(value)
+            except (ValueError, IndexError):
+                continue  # Skip if value not found
+        results['search'] = (time.perf_counter_ns() - start_time) / 1e9
     print(f"  Search: {results['search']:.2f} seconds")
     
     # Test deletion (values are still in the structure)
     print("  Testing deletion...")
-    start_time = time.time()
-    dataset_copy = dataset.copy()  # Make a copy for deletion
-    if not isinstance(data_structure, XORLinkedList):
-        # For trees, delete in sorted order to maintain balance
-        dataset_copy.sort()
-    
-    for value in dataset_copy:
-        try:
-            if isinstance(data_structure, XORLinkedList):
-                data_structure.delete(0)  # Delete from beginning for XOR list
-            else:
-                data_structure.delete(value)  # Delete by value for trees
-        except (ValueError, IndexError):
-            continue  # Skip if value not found
-    results['deletion'] = time.time() - start_time
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        for value in delete_order:
+            try:
+                delete_op(value)
+            except (ValueError, IndexError):
+                continue  # Skip if value not found
+        results['deletion'] = (time.perf_counter_ns() - start_time) / 1e9
     print(f"  Deletion: {results['deletion']:.2f} seconds")
     
     return results
 
+def benchmark_unbalanced_deletion(data_structure, dataset, delete_order):
+    """Test deleting every value with delete(rebalance=False).
+    
+    Only the B-tree has this mode: when every key gets deleted, rebalancing
+    on the way would only be undone by the next deletes. It is reported
+    apart from the balanced deletion that every tree is measured on.
+    """
+    for value in dataset:
+        data_structure.insert(value)
+    
+    print("  Testing deletion without rebalancing...")
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        for value in delete_order:
+            data_structure.delete(value, rebalance=False)
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    print(f"  Deletion (no rebalance): {elapsed:.2f} seconds")
+    return elapsed
+
+def benchmark_bulk_insertion(data_structure, dataset):
+    """Test building a structure from the whole dataset in one bulk load."""
+    print("  Testing bulk insertion...")
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        data_structure.bulk_load(dataset)
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    print(f"  Bulk insertion: {elapsed:.2f} seconds")
+    return elapsed
+
+def benchmark_batch_insertion(data_structure, dataset):
+    """Test inserting the whole dataset, in order, with one insert_many call.
+    
+    Unlike a bulk load, this runs the regular insertion algorithm for every
+    value; only the loop over the values moves into the structure.
+    """
+    print("  Testing batch insertion...")
+    with gc_paused():
+        start_time = time.perf_counter_ns()
+        data_structure.insert_many(dataset)
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    print(f"  Batch insertion: {elapsed:.2f} seconds")
+    return elapsed
+
 def save_results_to_csv(results, sizes):
     """Save performance results to a CSV file."""
+    import csv
+    
     with open('performance_results.csv', 'w', newline='') as csvfile:
         writer = csv.writer(csvfile)
         # Write header
@@ -69,7 +175,9 @@ def save_results_to_csv(results, sizes):
         # Write data
         for size_idx, size in enumerate(sizes):
             for structure in results:
-                for operation in ['insertion', 'search', 'deletion']:
+                for operation in OPERATIONS:
+                    if not results[structure][operation]:
+                        continue  # Operation not supported by this structure
                     writer.writerow([
                         size,
                         structure,
@@ -78,52 +186,121 @@ def save_results_to_csv(results, sizes):
                     ])
     print("\nResults saved to performance_results.csv")
 
+def plot_results(results, sizes):
+    """Save one comparison graph per operation to the graphs directory."""
+    # matplotlib is imported only now since it is slow to load, especially
+    # under PyPy, and not needed to measure. Agg renders straight to files
+    # without initializing a GUI backend.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    for operation in OPERATIONS:
+        fig, ax = plt.subplots(figsize=(12, 6))
+        for name in results:
+            if results[name][operation]:
+                ax.plot(sizes, results[name][operation], marker='o', label=name)
+        
+        ax.set_xlabel('Dataset Size')
+        ax.set_ylabel('Time (seconds)')
+        ax.set_title(f'{operation.capitalize()} Performance Comparison')
+        ax.legend()
+        ax.grid(True)
+        slug = re.sub(r'\W+', '_', operation).strip('_')
+        fig.savefig(f"graphs/{slug}_performance.png")
+        plt.close(fig)  # Release the figure instead of keeping it in pyplot
+        print(f"\nSaved {operation} performance graph")
+
+def bench_one(name, dataset_path, sorted_path, cpu=None):
+    """Benchmark one structure on a saved dataset inside a worker process.
+    
+    Args:
+        name (str): Key of the structure in STRUCTURES
+        dataset_path (str): Path of the .npy file holding the dataset
+        sorted_path (str): Path of the .npy file holding the dataset sorted
+        cpu (int, optional): CPU to pin this process to, where supported
+        
+    Returns:
+        dict: Time in seconds for each operation the structure supports
+    """
+    if cpu is not None:
+        # Keep concurrent workers off each other's cores
+        os.sched_setaffinity(0, {cpu})
+    
+    # Workers map the same files instead of each reading a private copy
+    dataset = np.load(dataset_path, mmap_mode='r', allow_pickle=False)
+    sorted_dataset = np.load(sorted_path, mmap_mode='r', allow_pickle=False)
+    
+    create_structure = STRUCTURES[name]
+    structure = create_structure()
+    if isinstance(structure, ARRAY_STRUCTURES):
+        data, delete_order = dataset, sorted_dataset
+    elif isinstance(structure, LIST_STRUCTURES):
+        data = delete_order = dataset.tolist()
+    else:
+        # Python-object structures get plain ints
+        data, delete_order = dataset.tolist(), sorted_dataset.tolist()
+    
+    print(f"\nTesting {name}...")
+    results = benchmark_data_structures(structure, data, delete_order)
+    if isinstance(structure, BTree):
+        results['deletion (no rebalance)'] = benchmark_unbalanced_deletion(
+            create_structure(), data, delete_order
+        )
+    if hasattr(structure, 'bulk_load'):
+        results['bulk insertion'] = benchmark_bulk_insertion(create_structure(), data)
+    if hasattr(structure, 'insert_many'):
+        results['batch insertion'] = benchmark_batch_insertion(create_structure(), data)
+    return results
+
 def run_performance_analysis():
-    """Run performance analysis for all operations on increasing dataset sizes."""
-    structures = {
-        'B-Tree': lambda: BTree(3),
-        'Red-Black Tree': lambda: RedBlackTree(),
-        'XOR Linked List': lambda: XORLinkedList()
-    }
-    
-    results = {name: {'insertion': [], 'search': [], 'deletion': []} for name in structures}
+    """Run performance analysis for all operations on increasing dataset sizes.
+    
+    The structures are independent, so for each dataset size they are
+    benchmarked concurrently, one worker process per structure.
+    """
+    results = {name: {operation: [] for operation in OPERATIONS} for name in STRUCTURES}
     sizes = []
     
     generator = DatasetGenerator()
     
-    # Test each size from 100k to 1M
-    for size in range(100000, 1100000, 100000):
-        print(f"\nTesting dataset size: {size:,}")
-        dataset = generator.generate_dataset(size, seed=42)
-        sizes.append(size)
-        
-        # Test each data structure
-        for name, create_structure in structures.items():
-            print(f"\nTesting {name}...")
-            structure = create_structure()
-            operation_times = benchmark_data_structures(structure, dataset)
+    # Pin each worker to its own CPU when there are enough of them
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_setaffinity') else []
+    if len(cpus) < len(STRUCTURES):
+        cpus = [None] * len(STRUCTURES)
+    
+    # Spawned workers start from a clean interpreter instead of a fork of this one.
+    # Never run more workers than CPUs, or they would time each other.
+    context = multiprocessing.get_context('spawn')
+    workers = min(len(STRUCTURES), os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # Test each size from 100k to 1M
+        for size in range(100000, 1100000, 100000):
+            print(f"\nTesting dataset size: {size:,}")
+            dataset = generator.generate_dataset(size, seed=42)
+            dataset_path = os.path.join(tmp_dir, f"dataset_{size}.npy")
+            np.save(dataset_path, dataset)
+            # Trees delete in sorted order; sort once for all workers
+            sorted_path = os.path.join(tmp_dir, f"dataset_{size}_sorted.npy")
+            np.save(sorted_path, np.sort(dataset))
+            sizes.append(size)
             
-            # Store results
-            for operation, time_taken in operation_times.items():
-                results[name][operation].append(time_taken)
+            # Test each data structure
+            futures = {
+                pool.submit(bench_one, name, dataset_path, sorted_path, cpu): name
+                for name, cpu in zip(STRUCTURES, cpus)
+            }
+            for future in as_completed(futures):
+                # Store results
+                for operation, time_taken in future.result().items():
+                    results[futures[future]][operation].append(time_taken)
     
     # Save results to CSV
     save_results_to_csv(results, sizes)
     
-    # Plot results for each operation
-    operations = ['insertion', 'search', 'deletion']
-    for operation in operations:
-        plt.figure(figsize=(12, 6))
-        for name in structures:
-            plt.plot(sizes, results[name][operation], marker='o', label=name)
-        
-        plt.xlabel('Dataset Size')
-        plt.ylabel('Time (seconds)')
-        plt.title(f'{operation.capitalize()} Performance Comparison')
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(f'graphs/{operation}_performance.png')
-        print(f"\nSaved {operation} performance graph")
+    # Plot only once every measurement is done
+    plot_results(results, sizes)
 
 if __name__ == '__main__':
     run_performance_analysis()
@@ -4,6 +4,21 @@ Advanced Data Structures module implementing complex tree and list structures.
 
 from .red_black_tree import RedBlackTree
 from .xor_linked_list import XORLinkedList
+from .doubly_linked_list import DoublyLinkedList
 from .b_tree import BTree
 
-__all__ = ['RedBlackTree', 'XORLinkedList', 'BTree']
+__all__ = ['RedBlackTree', 'XORLinkedList', 'DoublyLinkedList', 'BTree']
+
+try:
+    from .numba_b_tree import NumbaBTree
+except ImportError:  # numba is unavailable, e.g. when running under PyPy
+    pass
+else:
+    __all__.append('NumbaBTree')
+
+try:
+    from .numba_red_black_tree import NumbaRedBlackTree, RedBlackTreeInt
+except ImportError:  # numba is unavailable, e.g. when running under PyPy
+    pass
+else:
+    __all__ += ['NumbaRedBlackTree', 'RedBlackTreeInt']
@@ -13,22 +13,29 @@ Properties:
 5. A non-leaf node with k children contains k-1 keys
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+
 class Node:
     """A node in the B-tree.
     
     Attributes:
-        keys (list): List of keys stored in the node
+        keys (list or array.array): Keys stored in the node
         children (list): List of child nodes
         leaf (bool): True if this is a leaf node
     """
     
-    def __init__(self, leaf=True):
+    __slots__ = ('keys', 'children', 'leaf')
+    
+    def __init__(self, leaf=True, keys=None):
         """Initialize a new node.
         
         Args:
             leaf (bool): True if this is a leaf node
+            keys (list or array.array, optional): Empty key container to use,
+                defaults to a new list
         """
-        self.keys = []
+        self.keys = [] if keys is None else keys
         self.children = []
         self.leaf = leaf
 
@@ -41,16 +48,41 @@ class BTree:
     Attributes:
         root (Node): Root node of the tree
         t (int): Minimum degree (minimum number of keys = t-1)
+    
+    Nodes emptied by merges are kept on a free list and reused by later
+    splits instead of being left to the garbage collector.
+    
+    With cache_leaf=True, the leaf reached by the last insertion is
+    remembered together with the separator keys that bound it, so a
+    following key that falls in the same range goes straight into that leaf
+    without descending from the root. This pays off for sorted or clustered
+    keys; for uniformly random keys consecutive inserts almost never share
+    a leaf, so only the bookkeeping is paid, which is why it is off by
+    default.
     """
     
-    def __init__(self, t):
+    def __init__(self, t, typecode=None, cache_leaf=False):
         """Initialize an empty B-tree with the given minimum degree.
         
+        Keys are kept in plain lists by default, so any comparable type can
+        be stored. Passing an array typecode such as 'q' stores the keys of
+        every node unboxed in an array.array instead, which saves memory
+        for large trees of machine-sized numbers.
+        
         Args:
             t (int): Minimum degree of the tree (minimum number of keys = t-1)
+            typecode (str, optional): array.array typecode for node keys
+            cache_leaf (bool): Insert straight into the last leaf when the
+                key falls within its bounds
         """
-        self.root = Node()
         self.t = t  # Minimum degree
+        self.typecode = typecode
+        self.cache_leaf = cache_leaf
+        self._free = []  # Released nodes available for reuse
+        self.root = self._alloc_node()
+        self._last_leaf = None  # Leaf touched by the last insertion
+        self._last_bounds = (None, None)  # Separators around it (None = open)
+        self._unbalanced = False  # Set by deletes with rebalance=False
     
     def insert(self, k):
         """Insert a key into the B-tree.
@@ -58,10 +90,20 @@ class BTree:
         Args:
             k: Key to be inserted
         """
+        leaf = self._last_leaf
+        if leaf is not None and len(leaf.keys) < (2 * self.t) - 1:
+            low, high = self._last_bounds
+            if (low is None or low <= k) and (high is None or k <= high):
+                leaf.keys.insert(bisect_right(leaf.keys, k), k)
+                return
+        
+        if self._unbalanced:
+            self._rebuild()
+        
         root = self.root
         if len(root.keys) == (2 * self.t) - 1:
             # If root is full, create new root
-            new_root = Node(leaf=False)
+            new_root = self._alloc_node(leaf=False)
             self.root = new_root
             new_root.children.append(root)
             self._split_child(new_root, 0)
@@ -80,20 +122,156 @@ class BTree:
         """
         return self._search(self.root, k) is not None
     
-    def delete(self, k):
+    def delete(self, k, rebalance=True):
         """Delete a key from the B-tree.
         
+        With rebalance=False the key is removed without borrowing from or
+        merging siblings, so nodes may drop below t-1 keys and emptied
+        subtrees are pruned instead. This is meant for mass deletion, where
+        every key is about to be removed anyway. Reads stay correct, but
+        from then on the tree has underfull nodes and leaves at different
+        depths, which the balanced algorithms cannot work on. The next
+        balanced delete or insert therefore first rebuilds the tree from its
+        remaining keys, in O(n).
+        
         Args:
             k: Key to be deleted
+            rebalance (bool): Keep every node at least half full
             
         Raises:
             ValueError: If key not found in tree
         """
-        self._delete_key(self.root, k)
+        self._last_leaf = None  # Merges may detach or reuse the cached leaf
+        if rebalance:
+            if self._unbalanced:
+                self._rebuild()
+            self._delete_key(self.root, k)
+        else:
+            self._unbalanced = True
+            self._delete_key_unbalanced(self.root, k)
+    
+    def bulk_load(self, keys):
+        """Build the tree from a collection of keys in one bottom-up pass.
+        
+        The keys are sorted once and packed into leaves, then each level of
+        separator keys is packed into parent nodes until a single root
+        remains. No node is ever split, so this runs in O(n log n) for the
+        sort plus O(n) for the build. Replaces the current contents.
         
+        Args:
+            keys (iterable): Keys to load
+        """
+        self._last_leaf = None
+        self._unbalanced = False
+        keys = sorted(keys)
+        nodes, separators = self._pack_level(keys, None)
+        while len(nodes) > 1:
+            nodes, separators = self._pack_level(separators, nodes)
+        self.root = nodes[0]
    
     # Private Methods
     
+    def _alloc_node(self, leaf=True):
+        """Return an empty node, reusing a released one when available.
+        
+        Args:
+            leaf (bool): True if the node will be a leaf
+            
+        Returns:
+            Node: An empty node
+        """
+        if self._free:
+            node = self._free.pop()
+            del node.keys[:]  # array.array has no clear()
+            node.children.clear()
+            node.leaf = leaf
+            return node
+        if self.typecode is None:
+            return Node(leaf=leaf)
+        return Node(leaf=leaf, keys=array(self.typecode))
+    
+    def _release_node(self, node):
+        """Put a node that is no longer part of the tree on the free list.
+        
+        The node is only cleared when it is handed out again, so callers may
+        still read it while finishing the current operation.
+        
+        Args:
+            node (Node): Detached node
+        """
+        self._free.append(node)
+    
+    def _rebuild(self):
+        """Rebuild a tree left unbalanced by deletes with rebalance=False.
+        
+        The remaining keys are collected in order and bulk loaded into the
+        released nodes of the old tree.
+        """
+        keys = []
+        nodes = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.children)
+        self._collect_keys(self.root, keys)
+        for node in nodes:
+            self._release_node(node)
+        self.bulk_load(keys)
+    
+    def _collect_keys(self, x, keys):
+        """Append the keys of the subtree rooted at x to keys, in order.
+        
+        Args:
+            x (Node): Root of subtree
+            keys (list): List to append to
+        """
+        if x.leaf:
+            keys.extend(x.keys)
+            return
+        for i, key in enumerate(x.keys):
+            self._collect_keys(x.children[i], keys)
+            keys.append(key)
+        self._collect_keys(x.children[-1], keys)
+    
+    def _pack_level(self, keys, children):
+        """Pack one tree level during a bulk load.
+        
+        Uses as few nodes as possible while spreading the keys evenly, so
+        every node holds between t-1 and 2t-1 keys. The key between two
+        adjacent nodes is lifted out as a separator for the level above.
+        
+        Args:
+            keys (list): Sorted keys for this level
+            children (list): Nodes of the level below (len(keys) + 1 of
+                them), or None when packing leaves
+            
+        Returns:
+            tuple: (nodes, separators) for this level
+        """
+        t = self.t
+        n = len(keys)
+        count = 1 if n <= 2 * t - 1 else (n + 2 * t) // (2 * t)
+        base, extra = divmod(n - (count - 1), count)
+        
+        nodes = []
+        separators = []
+        pos = 0
+        child_pos = 0
+        for j in range(count):
+            size = base + 1 if j < extra else base
+            node = self._alloc_node(leaf=children is None)
+            node.keys.extend(keys[pos:pos + size])
+            pos += size
+            if children is not None:
+                node.children = children[child_pos:child_pos + size + 1]
+                child_pos += size + 1
+            nodes.append(node)
+            if j < count - 1:
+                separators.append(keys[pos])
+                pos += 1
+        return nodes, separators
+    
     def _split_child(self, x, i):
         """Split the i-th child of node x.
         
@@ -103,9 +281,12 @@ class BTree:
         """
         t = self.t
         y = x.children[i]
-        z = Node(leaf=y.leaf)
+        z = self._alloc_node(leaf=y.leaf)
+        if y is self._last_leaf:
+            self._last_leaf = None  # Its upper bound is about to shrink
         
         # Move keys and children from y to z
+        middle = y.keys[t-1]
         z.keys = y.keys[t:]
         y.keys = y.keys[:t-1]
         
@@ -114,34 +295,42 @@ class BTree:
             y.children = y.children[:t]
         
         # Insert middle key into parent
-        x.keys.insert(i, y.keys.pop())
+        x.keys.insert(i, middle)
         x.children.insert(i + 1, z)
     
     def _insert_non_full(self, x, k):
         """Insert key k into non-full node x.
         
+        With cache_leaf set, remembers the leaf the key lands in, and the
+        separators bounding it, for the fast path in insert.
+        
         Args:
             x (Node): Node to insert into
             k: Key to insert
         """
-        i = len(x.keys) - 1
-        
-        if x.leaf:
-            # Insert key into leaf node
-            while i >= 0 and k < x.keys[i]:
-                i -= 1
-            x.keys.insert(i + 1, k)
-        else:
-            # Find child to recurse on
-            while i >= 0 and k < x.keys[i]:
-                i -= 1
-            i += 1
-            
-            if len(x.children[i].keys) == (2 * self.t) - 1:
+        max_keys = (2 * self.t) - 1
+        track = self.cache_leaf
+        low = high = None
+        while not x.leaf:
+            # Find child to descend into
+            keys = x.keys
+            i = bisect_right(keys, k)
+            if len(x.children[i].keys) == max_keys:
                 self._split_child(x, i)
-                if k > x.keys[i]:
+                if k > keys[i]:
                     i += 1
-            self._insert_non_full(x.children[i], k)
+            if track:
+                if i:
+                    low = keys[i-1]
+                if i < len(keys):
+                    high = keys[i]
+            x = x.children[i]
+        
+        # Insert key into leaf node
+        x.keys.insert(bisect_right(x.keys, k), k)
+        if track:
+            self._last_leaf = x
+            self._last_bounds = (low, high)
     
     def _search(self, x, k):
         """Search for key k in subtree rooted at x.
@@ -153,21 +342,24 @@ class BTree:
         Returns:
             tuple: (node, index) if key found, None otherwise
         """
-        i = 0
-        while i < len(x.keys) and k > x.keys[i]:
-            i += 1
+        while True:
+            i = bisect_left(x.keys, k)
             
-        if i < len(x.keys) and k == x.keys[i]:
-            return (x, i)
+            if i < len(x.keys) and k == x.keys[i]:
+                return (x, i)
             
-        if x.leaf:
-            return None
+            if x.leaf:
+                return None
             
-        return self._search(x.children[i], k)
+            x = x.children[i]
     
     def _delete_key(self, x, k):
         """Delete key k from subtree rooted at x.
         
+        Walks down in a single pass, topping up every child to at least t
+        keys before descending into it, so that a key can always be removed
+        from the node it ends up in.
+        
         Args:
             x (Node): Root of subtree
             k: Key to delete
@@ -176,50 +368,108 @@ class BTree:
             ValueError: If key not found
         """
         t = self.t
-        i = 0
-        while i < len(x.keys) and k > x.keys[i]:
-            i += 1
+        while True:
+            i = bisect_left(x.keys, k)
+            found = i < len(x.keys) and x.keys[i] == k
             
-        if x.leaf:
-            if i < len(x.keys) and x.keys[i] == k:
+            if x.leaf:
+                if not found:
+                    raise ValueError("Key not found in tree")
                 x.keys.pop(i)
-            else:
-                raise ValueError("Key not found in tree")
-        else:
-            if i < len(x.keys) and x.keys[i] == k:
-                self._delete_from_internal_node(x, k, i)
-            else:
-                if i == len(x.keys):
-                    i -= 1
-                child = x.children[i]
-                
-                if len(child.keys) < t:
-                    self._fill_child(x, i)
-                    
+                return
+            
+            if found:
+                x, k = self._delete_from_internal_node(x, k, i)
+                continue
+            
+            if len(x.children[i].keys) < t:
+                self._fill_child(x, i)
                 if i > len(x.keys):
-                    self._delete_key(x.children[i-1], k)
+                    # Child i was merged into its previous sibling
+                    i -= 1
+            x = x.children[i]
+    
+    def _delete_key_unbalanced(self, x, k):
+        """Delete key k from subtree rooted at x without rebalancing.
+        
+        Args:
+            x (Node): Root of subtree
+            k: Key to delete
+            
+        Raises:
+            ValueError: If key not found
+        """
+        while True:
+            i = bisect_left(x.keys, k)
+            found = i < len(x.keys) and x.keys[i] == k
+            
+            if x.leaf:
+                if not found:
+                    raise ValueError("Key not found in tree")
+                x.keys.pop(i)
+                return
+            
+            if found:
+                pred = self._pop_max(x.children[i])
+                if pred is None:
+                    # Left subtree is empty: drop it together with the key
+                    x.keys.pop(i)
+                    x.children.pop(i)
                 else:
-                    self._delete_key(x.children[i], k)
+                    x.keys[i] = pred
+                
+                while not self.root.leaf and not self.root.keys:
+                    self.root = self.root.children[0]
+                return
+            
+            x = x.children[i]
+    
+    def _pop_max(self, x):
+        """Remove and return the largest key in the subtree rooted at x.
+        
+        Empty subtrees met on the way are pruned. Used by unbalanced
+        deletion, where subtrees may have run out of keys.
+        
+        Args:
+            x (Node): Root of subtree
+            
+        Returns:
+            The removed key, or None if the subtree holds no keys
+        """
+        if x.leaf:
+            return x.keys.pop() if x.keys else None
+        key = self._pop_max(x.children[-1])
+        if key is None and x.keys:
+            # Last subtree is empty, so x's own last key is the largest
+            key = x.keys.pop()
+            x.children.pop()
+        return key
     
     def _delete_from_internal_node(self, x, k, i):
         """Delete key k from internal node x.
         
+        The key is overwritten by its predecessor or successor, or pushed
+        down by a merge; either way one key is left to delete further down.
+        
         Args:
             x (Node): Internal node
             k: Key to delete
             i (int): Index of key in node
+            
+        Returns:
+            tuple: (node, key) still to be deleted from the subtree at node
         """
-        if x.children[i].keys:
+        if len(x.children[i].keys) >= self.t:
             pred = self._get_predecessor(x, i)
             x.keys[i] = pred
-            self._delete_key(x.children[i], pred)
-        elif x.children[i+1].keys:
+            return x.children[i], pred
+        elif len(x.children[i+1].keys) >= self.t:
             successor = self._get_successor(x, i)
             x.keys[i] = successor
-            self._delete_key(x.children[i+1], successor)
+            return x.children[i+1], successor
         else:
             self._merge_children(x, i)
-            self._delete_key(x.children[i], k)
+            return x.children[i], k
     
     def _get_predecessor(self, x, i):
         """Get predecessor of keys[i] in node x.
@@ -269,7 +519,11 @@ class BTree:
                 self._merge_children(x, i-1)
     
     def _borrow_from_prev(self, x, i):
-        """Borrow a key from previous sibling.
+        """Borrow keys from previous sibling.
+        
+        Half of the sibling's surplus moves over in one slice, so the child
+        does not have to borrow again on the next few deletes and the
+        child's keys are shifted once per batch rather than once per key.
         
         Args:
             x (Node): Parent node
@@ -277,15 +531,30 @@ class BTree:
         """
         child = x.children[i]
         sibling = x.children[i-1]
+        n = len(sibling.keys)
+        m = (n - len(child.keys)) // 2
+        if m <= 1:
+            child.keys.insert(0, x.keys[i-1])
+            if not child.leaf:
+                child.children.insert(0, sibling.children.pop())
+            x.keys[i-1] = sibling.keys.pop()
+            return
+        cut = n - m
         
-        child.keys.insert(0, x.keys[i-1])
+        moved = sibling.keys[cut+1:]
+        moved.append(x.keys[i-1])
+        child.keys[:0] = moved
         if not child.leaf:
-            child.children.insert(0, sibling.children.pop())
+            child.children[:0] = sibling.children[cut+1:]
+            del sibling.children[cut+1:]
             
-        x.keys[i-1] = sibling.keys.pop()
+        x.keys[i-1] = sibling.keys[cut]
+        del sibling.keys[cut:]
     
     def _borrow_from_next(self, x, i):
-        """Borrow a key from next sibling.
+        """Borrow keys from next sibling.
+        
+        Moves half of the sibling's surplus at once, like _borrow_from_prev.
         
         Args:
             x (Node): Parent node
@@ -293,12 +562,22 @@ class BTree:
         """
         child = x.children[i]
         sibling = x.children[i+1]
+        m = (len(sibling.keys) - len(child.keys)) // 2
+        if m <= 1:
+            child.keys.append(x.keys[i])
+            if not child.leaf:
+                child.children.append(sibling.children.pop(0))
+            x.keys[i] = sibling.keys.pop(0)
+            return
         
         child.keys.append(x.keys[i])
+        child.keys.extend(sibling.keys[:m-1])
         if not child.leaf:
-            child.children.append(sibling.children.pop(0))
+            child.children.extend(sibling.children[:m])
+            del sibling.children[:m]
             
-        x.keys[i] = sibling.keys.pop(0)
+        x.keys[i] = sibling.keys[m-1]
+        del sibling.keys[:m]
     
     def _merge_children(self, x, i):
         """Merge children i and i+1 of x.
@@ -317,6 +596,8 @@ class BTree:
             child.children.extend(sibling.children)
             
         x.children.pop(i+1)
+        self._release_node(sibling)
         
         if x == self.root and not x.keys:
             self.root = child
+            self._release_node(x)
@@ -1,8 +1,8 @@
-import random
-import json
 import os
 from pathlib import Path
 
+import numpy as np
+
 class DatasetGenerator:
     """Generator for creating and managing datasets for performance testing."""
     
@@ -28,38 +28,37 @@ class DatasetGenerator:
             seed (int, optional): Random seed for reproducibility
             
         Returns:
-            list: Generated dataset
+            numpy.ndarray: Generated dataset as an int64 array
         """
-        if seed is not None:
-            random.seed(seed)
-            
-        return [random.randint(self.min_value, self.max_value) for _ in range(size)]
+        rng = np.random.default_rng(seed)
+        return rng.integers(self.min_value, self.max_value + 1, size=size, dtype=np.int64)
     
     def save_dataset(self, dataset, name):
         """
-        Save a dataset to a file.
+        Save a dataset to a binary .npy file.
         
         Args:
-            dataset (list): The dataset to save
+            dataset (list or numpy.ndarray): The dataset to save
             name (str): Name of the dataset file (without extension)
         """
-        file_path = self.datasets_dir / f"{name}.json"
-        with open(file_path, 'w') as f:
-            json.dump(dataset, f)
+        file_path = self.datasets_dir / f"{name}.npy"
+        np.save(file_path, np.asarray(dataset, dtype=np.int64), allow_pickle=False)
     
     def load_dataset(self, name):
         """
         Load a dataset from a file.
         
+        The file is memory-mapped rather than read, so processes loading the
+        same dataset share one copy through the page cache.
+        
         Args:
             name (str): Name of the dataset file (without extension)
             
         Returns:
-            list: The loaded dataset
+            numpy.ndarray: The loaded dataset (read-only)
         """
-        file_path = self.datasets_dir / f"{name}.json"
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        file_path = self.datasets_dir / f"{name}.npy"
+        return np.load(file_path, mmap_mode='r', allow_pickle=False)
     
     def generate_and_save(self, sizes, prefix="dataset", seed=None):
         """
@@ -74,7 +73,7 @@ class DatasetGenerator:
             dataset = self.generate_dataset(size, seed)
             name = f"{prefix}_{size}"
             self.save_dataset(dataset, name)
-            print(f"Generated and saved dataset with {size} elements as {name}.json")
+            print(f"Generated and saved dataset with {size} elements as {name}.npy")
     
     def list_datasets(self):
         """
@@ -83,7 +82,7 @@ class DatasetGenerator:
         Returns:
             list: Names of available datasets (without extension)
         """
-        return [f.stem for f in self.datasets_dir.glob("*.json")]
+        return [f.stem for f in self.datasets_dir.glob("*.npy")]
 
 def generate_standard_datasets(seed=42):
     """
@@ -0,0 +1,388 @@
+"""
+Implementation of a B-tree over flat integer arrays compiled with Numba.
+
+Instead of one Python object per node, every node is a row in a set of
+parallel NumPy arrays owned by the tree:
+
+- keys[node, j]: j-th key of the node (int64, at most 2t-1 per node)
+- children[node, j]: index of the j-th child (int32, at most 2t per node)
+- nkeys[node]: number of keys currently stored in the node
+- leaf[node]: True if the node is a leaf
+
+The insert, search and delete algorithms are module-level functions compiled
+with ``numba.njit`` that operate on these arrays directly, so the descent loops
+run as native code instead of interpreted attribute lookups. Within a node the
+key position is found with a branch-free count over the node's contiguous key
+row. Freed node rows are kept on a stack and reused by later splits.
+"""
+
+import numpy as np
+from numba import njit
+
+# An insert allocates at most one node per level plus a new root, and no
+# B-tree over int64 keys is this deep, so keeping this many free rows around
+# before each insert means the compiled code never has to grow the arrays.
+_MIN_FREE_NODES = 64
+
+_CACHE_LINE = 64  # bytes
+_NODE_CACHE_LINES = 4
+_KEYS_PER_LINE = _CACHE_LINE // np.dtype(np.int64).itemsize
+
+# Largest minimum degree whose key row (2t-1 keys, padded to 2t) fits in
+# _NODE_CACHE_LINES cache lines: t=16 gives 31 keys in exactly 256 bytes.
+DEFAULT_DEGREE = _NODE_CACHE_LINES * _CACHE_LINE // (2 * np.dtype(np.int64).itemsize)
+
+
+def _aligned_zeros(shape, dtype):
+    """Allocate a zeroed array whose data starts on a cache-line boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buf = np.zeros(nbytes + _CACHE_LINE, dtype=np.uint8)
+    offset = -buf.ctypes.data % _CACHE_LINE
+    return buf[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def _key_row_length(t):
+    """Slots per key row: 2t-1 keys padded up to whole cache lines."""
+    return -(-(2 * t - 1) // _KEYS_PER_LINE) * _KEYS_PER_LINE
+
+
+@njit(cache=True)
+def _lower_bound(keys, x, n, k):
+    """Index of the first of the n keys of node x that is >= k.
+
+    Counts the keys below k instead of stopping at the first larger one.
+    The loop has no data-dependent exit, so LLVM vectorizes it into SIMD
+    compares over the contiguous key row.
+    """
+    count = 0
+    for j in range(n):
+        count += keys[x, j] < k
+    return count
+
+
+@njit(cache=True)
+def _upper_bound(keys, x, n, k):
+    """Index of the first of the n keys of node x that is > k."""
+    count = 0
+    for j in range(n):
+        count += keys[x, j] <= k
+    return count
+
+
+@njit(cache=True)
+def _alloc_node(nkeys, leaf, free, top, is_leaf):
+    """Pop a free node row off the stack and reset it."""
+    top -= 1
+    node = free[top]
+    nkeys[node] = 0
+    leaf[node] = is_leaf
+    return node, top
+
+
+@njit(cache=True)
+def _split_child(keys, children, nkeys, leaf, free, top, x, i, t):
+    """Split the full i-th child of node x, returning the new stack top."""
+    y = children[x, i]
+    z, top = _alloc_node(nkeys, leaf, free, top, leaf[y])
+
+    # Move the upper t-1 keys (and t children) of y into z
+    keys[z, :t - 1] = keys[y, t:2 * t - 1]
+    if not leaf[y]:
+        children[z, :t] = children[y, t:2 * t]
+    nkeys[z] = t - 1
+    nkeys[y] = t - 1
+
+    # Make room in x for the middle key of y and the new child z
+    n = nkeys[x]
+    for j in range(n, i, -1):
+        children[x, j + 1] = children[x, j]
+    children[x, i + 1] = z
+    for j in range(n - 1, i - 1, -1):
+        keys[x, j + 1] = keys[x, j]
+    keys[x, i] = keys[y, t - 1]
+    nkeys[x] = n + 1
+    return top
+
+
+@njit(cache=True)
+def _insert(keys, children, nkeys, leaf, free, top, root, k, t):
+    """Insert key k, returning the (possibly new) root and stack top."""
+    if nkeys[root] == 2 * t - 1:
+        # If root is full, create new root
+        new_root, top = _alloc_node(nkeys, leaf, free, top, False)
+        children[new_root, 0] = root
+        top = _split_child(keys, children, nkeys, leaf, free, top, new_root, 0, t)
+        root = new_root
+
+    x = root
+    while not leaf[x]:
+        i = _upper_bound(keys, x, nkeys[x], k)
+        if nkeys[children[x, i]] == 2 * t - 1:
+            top = _split_child(keys, children, nkeys, leaf, free, top, x, i, t)
+            if k > keys[x, i]:
+                i += 1
+        x = children[x, i]
+
+    # Shift larger keys right and drop k into the gap
+    n = nkeys[x]
+    i = _upper_bound(keys, x, n, k)
+    for j in range(n, i, -1):
+        keys[x, j] = keys[x, j - 1]
+    keys[x, i] = k
+    nkeys[x] = n + 1
+    return root, top
+
+
+@njit(cache=True)
+def _search(keys, children, nkeys, leaf, root, k):
+    """Return True if key k is stored in the tree."""
+    x = root
+    while True:
+        n = nkeys[x]
+        i = _lower_bound(keys, x, n, k)
+        if i < n and k == keys[x, i]:
+            return True
+        if leaf[x]:
+            return False
+        x = children[x, i]
+
+
+@njit(cache=True)
+def _borrow_from_prev(keys, children, nkeys, leaf, x, i):
+    """Move a key from child i-1 of x through x into child i."""
+    child = children[x, i]
+    sibling = children[x, i - 1]
+    n = nkeys[child]
+
+    for j in range(n - 1, -1, -1):
+        keys[child, j + 1] = keys[child, j]
+    keys[child, 0] = keys[x, i - 1]
+    if not leaf[child]:
+        for j in range(n, -1, -1):
+            children[child, j + 1] = children[child, j]
+        children[child, 0] = children[sibling, nkeys[sibling]]
+
+    keys[x, i - 1] = keys[sibling, nkeys[sibling] - 1]
+    nkeys[child] = n + 1
+    nkeys[sibling] -= 1
+
+
+@njit(cache=True)
+def _borrow_from_next(keys, children, nkeys, leaf, x, i):
+    """Move a key from child i+1 of x through x into child i."""
+    child = children[x, i]
+    sibling = children[x, i + 1]
+    n = nkeys[child]
+    m = nkeys[sibling]
+
+    keys[child, n] = keys[x, i]
+    if not leaf[child]:
+        children[child, n + 1] = children[sibling, 0]
+    keys[x, i] = keys[sibling, 0]
+
+    for j in range(m - 1):
+        keys[sibling, j] = keys[sibling, j + 1]
+    if not leaf[sibling]:
+        for j in range(m):
+            children[sibling, j] = children[sibling, j + 1]
+    nkeys[child] = n + 1
+    nkeys[sibling] = m - 1
+
+
+@njit(cache=True)
+def _merge_children(keys, children, nkeys, leaf, free, top, x, i):
+    """Merge child i+1 of x and the separating key into child i.
+
+    Returns the new stack top after releasing the emptied sibling.
+    """
+    child = children[x, i]
+    sibling = children[x, i + 1]
+    n = nkeys[child]
+    m = nkeys[sibling]
+
+    keys[child, n] = keys[x, i]
+    keys[child, n + 1:n + 1 + m] = keys[sibling, :m]
+    if not leaf[child]:
+        children[child, n + 1:n + 2 + m] = children[sibling, :m + 1]
+    nkeys[child] = n + 1 + m
+
+    # Close the gap left in x
+    p = nkeys[x]
+    for j in range(i, p - 1):
+        keys[x, j] = keys[x, j + 1]
+    for j in range(i + 1, p):
+        children[x, j] = children[x, j + 1]
+    nkeys[x] = p - 1
+
+    free[top] = sibling
+    return top + 1
+
+
+@njit(cache=True)
+def _delete(keys, children, nkeys, leaf, free, top, root, k, t):
+    """Delete one occurrence of key k in a single top-down pass.
+
+    Every child is topped up to at least t keys before the descent enters it,
+    so the key can always be removed without walking back up the tree.
+
+    Returns:
+        tuple: (root, top, found)
+    """
+    x = root
+    while True:
+        n = nkeys[x]
+        i = _lower_bound(keys, x, n, k)
+
+        if i < n and keys[x, i] == k:
+            if leaf[x]:
+                for j in range(i, n - 1):
+                    keys[x, j] = keys[x, j + 1]
+                nkeys[x] = n - 1
+                return root, top, True
+
+            y = children[x, i]
+            z = children[x, i + 1]
+            if nkeys[y] >= t:
+                # Replace k with its predecessor and delete that instead
+                c = y
+                while not leaf[c]:
+                    c = children[c, nkeys[c]]
+                k = keys[c, nkeys[c] - 1]
+                keys[x, i] = k
+                x = y
+            elif nkeys[z] >= t:
+                # Replace k with its successor and delete that instead
+                c = z
+                while not leaf[c]:
+                    c = children[c, 0]
+                k = keys[c, 0]
+                keys[x, i] = k
+                x = z
+            else:
+                top = _merge_children(keys, children, nkeys, leaf, free, top, x, i)
+                if x == root and nkeys[x] == 0:
+                    free[top] = x
+                    top += 1
+                    root = y
+                x = y
+            continue
+
+        if leaf[x]:
+            return root, top, False
+
+        if nkeys[children[x, i]] < t:
+            if i > 0 and nkeys[children[x, i - 1]] >= t:
+                _borrow_from_prev(keys, children, nkeys, leaf, x, i)
+            elif i < n and nkeys[children[x, i + 1]] >= t:
+                _borrow_from_next(keys, children, nkeys, leaf, x, i)
+            else:
+                if i == n:
+                    i -= 1
+                top = _merge_children(keys, children, nkeys, leaf, free, top, x, i)
+                if x == root and nkeys[x] == 0:
+                    free[top] = x
+                    top += 1
+                    root = children[x, i]
+        x = children[x, i]
+
+
+class NumbaBTree:
+    """B-tree of integer keys stored in flat arrays and driven by compiled code.
+
+    Offers the same operations as ``BTree`` but only accepts keys that fit in
+    a signed 64-bit integer. Each node's keys occupy one contiguous,
+    cache-line aligned row of the key array, so with the default degree a
+    node is scanned by touching exactly four cache lines.
+
+    Attributes:
+        t (int): Minimum degree (minimum number of keys = t-1)
+        root (int): Row index of the root node
+    """
+
+    def __init__(self, t=DEFAULT_DEGREE, capacity=1024):
+        """Initialize an empty B-tree with the given minimum degree.
+
+        Args:
+            t (int): Minimum degree of the tree (minimum number of keys = t-1).
+                Defaults to the degree whose nodes fill four cache lines.
+            capacity (int): Number of node rows to preallocate
+        """
+        self.t = t
+        capacity = max(capacity, _MIN_FREE_NODES + 1)
+        # Key rows are padded to whole cache lines, so every row starts on
+        # a line boundary whatever the degree
+        self._keys = _aligned_zeros((capacity, _key_row_length(t)), np.int64)
+        self._children = _aligned_zeros((capacity, 2 * t), np.int32)
+        self._nkeys = np.zeros(capacity, dtype=np.int32)
+        self._leaf = np.zeros(capacity, dtype=np.bool_)
+        # Stack of free node rows; lowest indices are handed out first
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._top = capacity
+
+        self.root, self._top = _alloc_node(self._nkeys, self._leaf, self._free, self._top, True)
+
+    def insert(self, k):
+        """Insert a key into the B-tree.
+
+        Args:
+            k (int): Key to be inserted
+        """
+        if self._top < _MIN_FREE_NODES:
+            self._grow()
+        self.root, self._top = _insert(
+            self._keys, self._children, self._nkeys, self._leaf,
+            self._free, self._top, self.root, k, self.t
+        )
+
+    def read(self, k):
+        """Search for a key in the B-tree.
+
+        Args:
+            k (int): Key to search for
+
+        Returns:
+            bool: True if key exists in tree, False otherwise
+        """
+        return _search(self._keys, self._children, self._nkeys, self._leaf, self.root, k)
+
+    def delete(self, k):
+        """Delete a key from the B-tree.
+
+        Args:
+            k (int): Key to be deleted
+
+        Raises:
+            ValueError: If key not found in tree
+        """
+        self.root, self._top, found = _delete(
+            self._keys, self._children, self._nkeys, self._leaf,
+            self._free, self._top, self.root, k, self.t
+        )
+        if not found:
+            raise ValueError("Key not found in tree")
+
+    # Private Methods
+
+    def _grow(self):
+        """Double the number of node rows and push the new rows as free."""
+        old = len(self._nkeys)
+        new = old * 2
+
+        keys = _aligned_zeros((new, self._keys.shape[1]), np.int64)
+        keys[:old] = self._keys
+        children = _aligned_zeros((new, self._children.shape[1]), np.int32)
+        children[:old] = self._children
+        nkeys = np.zeros(new, dtype=np.int32)
+        nkeys[:old] = self._nkeys
+        leaf = np.zeros(new, dtype=np.bool_)
+        leaf[:old] = self._leaf
+
+        free = np.empty(new, dtype=np.int32)
+        free[:self._top] = self._free[:self._top]
+        added = new - old
+        free[self._top:self._top + added] = np.arange(new - 1, old - 1, -1, dtype=np.int32)
+
+        self._keys, self._children, self._nkeys, self._leaf = keys, children, nkeys, leaf
+        self._free = free
+        self._top += added
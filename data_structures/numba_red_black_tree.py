@@ -0,0 +1,603 @@
+"""
+Implementation of a Red-Black Tree over flat integer arrays compiled with Numba.
+
+Instead of one Python object per node, every node is a slot in a set of
+parallel NumPy arrays owned by the tree:
+
+- keys[node]: key stored in the node (int64)
+- links[node]: indices of the left child, right child and parent (int32).
+  The three links of a node share one 12-byte row, so a rotation or a
+  parent/uncle lookup touches one cache line per node instead of three.
+- color[node]: 1 for red, 0 for black (uint8)
+
+Slot 0 is the black NIL sentinel shared by all leaves, and it is also the
+parent of the root, so the compiled code never has to test for a missing
+node. The insert, search and delete algorithms are module-level functions
+compiled with ``numba.njit`` that operate on these arrays directly; each
+rotation or recoloring is a handful of array stores instead of interpreted
+attribute lookups. Freed slots are kept on a stack and reused by later
+inserts; storage starts at one chunk of slots and doubles when it runs out.
+"""
+
+import numpy as np
+from numba import njit
+
+NIL = 0  # Index of the sentinel node
+
+# Columns of the links array
+LEFT = 0
+RIGHT = 1
+PARENT = 2
+
+RED = 1
+BLACK = 0
+
+_CHUNK_SIZE = 4096  # Node slots allocated up front
+
+
+@njit(cache=True)
+def _left_rotate(links, root, x):
+    """Rotate the subtree rooted at x to the left, returning the root."""
+    y = links[x, RIGHT]
+    links[x, RIGHT] = links[y, LEFT]
+    if links[y, LEFT] != NIL:
+        links[links[y, LEFT], PARENT] = x
+    p = links[x, PARENT]
+    links[y, PARENT] = p
+    if p == NIL:
+        root = y
+    elif x == links[p, LEFT]:
+        links[p, LEFT] = y
+    else:
+        links[p, RIGHT] = y
+    links[y, LEFT] = x
+    links[x, PARENT] = y
+    return root
+
+
+@njit(cache=True)
+def _right_rotate(links, root, x):
+    """Rotate the subtree rooted at x to the right, returning the root."""
+    y = links[x, LEFT]
+    links[x, LEFT] = links[y, RIGHT]
+    if links[y, RIGHT] != NIL:
+        links[links[y, RIGHT], PARENT] = x
+    p = links[x, PARENT]
+    links[y, PARENT] = p
+    if p == NIL:
+        root = y
+    elif x == links[p, RIGHT]:
+        links[p, RIGHT] = y
+    else:
+        links[p, LEFT] = y
+    links[y, RIGHT] = x
+    links[x, PARENT] = y
+    return root
+
+
+@njit(cache=True)
+def _fix_insert(links, color, root, k):
+    """Restore the Red-Black properties after inserting k, returning the root.
+
+    Whatever the uncle's color, each step ends with the uncle and parent
+    black and the grandparent red, so those colors are stored unconditionally
+    and only the choice between moving up and rotating is left as a branch.
+    """
+    while color[links[k, PARENT]] == RED:
+        p = links[k, PARENT]
+        g = links[p, PARENT]
+        if p == links[g, RIGHT]:  # Parent is right child
+            u = links[g, LEFT]  # Uncle
+            uncle_red = color[u]
+            if not uncle_red and k == links[p, LEFT]:  # k is left child
+                k = p
+                root = _right_rotate(links, root, k)
+                p = links[k, PARENT]
+            color[u] = BLACK
+            color[p] = BLACK
+            color[g] = RED
+            if uncle_red:
+                k = g
+            else:
+                root = _left_rotate(links, root, g)
+        else:  # Parent is left child
+            u = links[g, RIGHT]  # Uncle
+            uncle_red = color[u]
+            if not uncle_red and k == links[p, RIGHT]:  # k is right child
+                k = p
+                root = _left_rotate(links, root, k)
+                p = links[k, PARENT]
+            color[u] = BLACK
+            color[p] = BLACK
+            color[g] = RED
+            if uncle_red:
+                k = g
+            else:
+                root = _right_rotate(links, root, g)
+    color[root] = BLACK
+    return root
+
+
+@njit(cache=True)
+def _insert(keys, links, color, free, top, root, k):
+    """Insert key k, returning the new root and stack top."""
+    top -= 1
+    node = free[top]
+    keys[node] = k
+    links[node, LEFT] = NIL
+    links[node, RIGHT] = NIL
+    color[node] = RED
+
+    y = NIL
+    x = root
+    while x != NIL:
+        y = x
+        if k < keys[x]:
+            x = links[x, LEFT]
+        else:
+            x = links[x, RIGHT]
+
+    links[node, PARENT] = y
+    if y == NIL:
+        root = node  # Tree was empty
+    elif k < keys[y]:
+        links[y, LEFT] = node
+    else:
+        links[y, RIGHT] = node
+
+    return _fix_insert(links, color, root, node), top
+
+
+@njit(cache=True)
+def _insert_many(keys, links, color, free, top, root, values):
+    """Insert every key of values in order, returning the new root and stack top.
+
+    The whole loop runs in compiled code, so a batch pays for a single call
+    from Python instead of one per key.
+    """
+    for i in range(len(values)):
+        root, top = _insert(keys, links, color, free, top, root, values[i])
+    return root, top
+
+
+@njit(cache=True)
+def _build(keys, links, color, values, red_depth):
+    """Build a balanced tree from sorted values, returning its root.
+
+    values[i] goes into slot i + 1 and the middle of every range becomes
+    the root of its subtree. All levels but the deepest are complete, so
+    coloring that level red and the rest black satisfies the Red-Black
+    properties without rotations. The slots must be freshly zeroed.
+    """
+    n = len(values)
+    if n == 0:
+        return NIL
+    keys[1:n + 1] = values
+
+    # Ranges still to build: (lo, hi, parent, is_left_child, depth)
+    stack = np.empty((2 * 64 + 2, 5), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n
+    stack[0, 2] = NIL
+    stack[0, 3] = 0
+    stack[0, 4] = 0
+    size = 1
+    root = NIL
+    while size:
+        size -= 1
+        lo = stack[size, 0]
+        hi = stack[size, 1]
+        parent = stack[size, 2]
+        depth = stack[size, 4]
+        mid = (lo + hi) // 2
+        node = mid + 1
+        links[node, PARENT] = parent
+        color[node] = RED if depth == red_depth else BLACK
+        if parent == NIL:
+            root = node
+        elif stack[size, 3]:
+            links[parent, LEFT] = node
+        else:
+            links[parent, RIGHT] = node
+        if lo < mid:
+            stack[size, 0] = lo
+            stack[size, 1] = mid
+            stack[size, 2] = node
+            stack[size, 3] = 1
+            stack[size, 4] = depth + 1
+            size += 1
+        if mid + 1 < hi:
+            stack[size, 0] = mid + 1
+            stack[size, 1] = hi
+            stack[size, 2] = node
+            stack[size, 3] = 0
+            stack[size, 4] = depth + 1
+            size += 1
+    color[root] = BLACK
+    return root
+
+
+@njit(cache=True)
+def _find_node(keys, links, root, k):
+    """Return the index of a node holding key k, or NIL."""
+    x = root
+    while x != NIL:
+        if k == keys[x]:
+            return x
+        elif k < keys[x]:
+            x = links[x, LEFT]
+        else:
+            x = links[x, RIGHT]
+    return NIL
+
+
+@njit(cache=True)
+def _search(keys, links, root, k):
+    """Return True if key k is stored in the tree."""
+    return _find_node(keys, links, root, k) != NIL
+
+
+@njit(cache=True)
+def _minimum(links, x):
+    """Return the node with the smallest key in the subtree rooted at x."""
+    while links[x, LEFT] != NIL:
+        x = links[x, LEFT]
+    return x
+
+
+@njit(cache=True)
+def _transplant(links, root, u, v):
+    """Replace the subtree rooted at u with the one at v, returning the root."""
+    p = links[u, PARENT]
+    if p == NIL:
+        root = v
+    elif u == links[p, LEFT]:
+        links[p, LEFT] = v
+    else:
+        links[p, RIGHT] = v
+    links[v, PARENT] = p
+    return root
+
+
+@njit(cache=True)
+def _fix_delete(links, color, root, x):
+    """Restore the Red-Black properties after a deletion, returning the root.
+
+    When the sibling's far child is black, the classic algorithm recolors
+    the sibling and its near child before rotating them, but the final case
+    then overwrites both colors, so only the rotation is kept.
+    """
+    while x != root and color[x] == BLACK:
+        p = links[x, PARENT]
+        if x == links[p, LEFT]:
+            w = links[p, RIGHT]
+            if color[w] == RED:
+                color[w] = BLACK
+                color[p] = RED
+                root = _left_rotate(links, root, p)
+                w = links[p, RIGHT]
+            if color[links[w, LEFT]] == BLACK and color[links[w, RIGHT]] == BLACK:
+                color[w] = RED
+                x = p
+            else:
+                if color[links[w, RIGHT]] == BLACK:
+                    # The recoloring below covers both nodes this moves
+                    root = _right_rotate(links, root, w)
+                    w = links[p, RIGHT]
+                color[w] = color[p]
+                color[p] = BLACK
+                color[links[w, RIGHT]] = BLACK
+                root = _left_rotate(links, root, p)
+                x = root
+        else:
+            w = links[p, LEFT]
+            if color[w] == RED:
+                color[w] = BLACK
+                color[p] = RED
+                root = _right_rotate(links, root, p)
+                w = links[p, LEFT]
+            if color[links[w, RIGHT]] == BLACK and color[links[w, LEFT]] == BLACK:
+                color[w] = RED
+                x = p
+            else:
+                if color[links[w, LEFT]] == BLACK:
+                    # The recoloring below covers both nodes this moves
+                    root = _left_rotate(links, root, w)
+                    w = links[p, LEFT]
+                color[w] = color[p]
+                color[p] = BLACK
+                color[links[w, LEFT]] = BLACK
+                root = _right_rotate(links, root, p)
+                x = root
+    color[x] = BLACK
+    return root
+
+
+@njit(cache=True)
+def _delete(keys, links, color, free, top, root, k):
+    """Delete one node holding key k.
+
+    Returns:
+        tuple: (root, top, found) where found is False if k is not stored
+    """
+    z = _find_node(keys, links, root, k)
+    if z == NIL:
+        return root, top, False
+
+    y = z
+    y_original_color = color[y]
+    if links[z, LEFT] == NIL:
+        x = links[z, RIGHT]
+        root = _transplant(links, root, z, x)
+    elif links[z, RIGHT] == NIL:
+        x = links[z, LEFT]
+        root = _transplant(links, root, z, x)
+    else:
+        y = _minimum(links, links[z, RIGHT])
+        y_original_color = color[y]
+        x = links[y, RIGHT]
+        if links[y, PARENT] == z:
+            links[x, PARENT] = y  # x may be NIL, whose parent _fix_delete reads
+        else:
+            root = _transplant(links, root, y, x)
+            links[y, RIGHT] = links[z, RIGHT]
+            links[links[y, RIGHT], PARENT] = y
+        root = _transplant(links, root, z, y)
+        links[y, LEFT] = links[z, LEFT]
+        links[links[y, LEFT], PARENT] = y
+        color[y] = color[z]
+
+    if y_original_color == BLACK:
+        root = _fix_delete(links, color, root, x)
+
+    free[top] = z
+    top += 1
+    return root, top, True
+
+
+class NumbaRedBlackTree:
+    """Red-Black Tree of integer keys stored in flat arrays and driven by compiled code.
+
+    Offers the same operations as ``RedBlackTree`` but only accepts keys that
+    fit in a signed 64-bit integer.
+
+    Attributes:
+        root (int): Slot index of the root node (0 when the tree is empty)
+    """
+
+    def __init__(self, capacity=_CHUNK_SIZE):
+        """Initialize an empty Red-Black Tree.
+
+        Args:
+            capacity (int): Number of node slots to preallocate
+        """
+        self._allocate(capacity)
+
+    def insert(self, data):
+        """Insert a new node with the given data.
+
+        Args:
+            data (int): The data to be inserted
+        """
+        if self._top == 0:
+            self._grow()
+        self.root, self._top = _insert(
+            self._keys, self._links, self._color,
+            self._free, self._top, self.root, data
+        )
+
+    def read(self, data):
+        """Search for a node with the given data.
+
+        Args:
+            data (int): The data to search for
+
+        Returns:
+            bool: True if data exists in tree, False otherwise
+        """
+        return _search(self._keys, self._links, self.root, data)
+
+    def delete(self, data):
+        """Delete the node with the given data.
+
+        Args:
+            data (int): The data to be deleted
+
+        Raises:
+            ValueError: If data not found in tree
+        """
+        self.root, self._top, found = _delete(
+            self._keys, self._links, self._color,
+            self._free, self._top, self.root, data
+        )
+        if not found:
+            raise ValueError("Data not found in tree")
+
+    def insert_many(self, values):
+        """Insert every value, in order, in one compiled call.
+
+        The tree ends up exactly as after repeated calls to insert, but a
+        batch crosses from Python into compiled code once instead of once
+        per value, and storage is grown for the whole batch up front.
+
+        Args:
+            values (array-like of int): Values to insert
+        """
+        values = np.asarray(values, dtype=np.int64)
+        while self._top < len(values):
+            self._grow()
+        self.root, self._top = _insert_many(
+            self._keys, self._links, self._color,
+            self._free, self._top, self.root, values
+        )
+
+    def bulk_load(self, values):
+        """Build the tree from a collection of values in one pass.
+
+        Like RedBlackTree.bulk_load, the values are sorted and built into a
+        perfectly balanced tree without rotations or insert fixups, here in
+        a single compiled call. Replaces the current contents.
+
+        Args:
+            values (array-like of int): Values to load
+        """
+        values = np.sort(np.asarray(values, dtype=np.int64))
+        n = len(values)
+        self._allocate(max(n, _CHUNK_SIZE))
+        # Depth of the deepest level; only that level can be incomplete
+        red_depth = n.bit_length() - 1
+        self.root = _build(self._keys, self._links, self._color, values, red_depth)
+        self._top -= n  # Slots 1..n are on top of the free stack
+
+    # Private methods
+
+    def _allocate(self, capacity):
+        """Start over with empty storage for the given number of nodes."""
+        capacity = max(capacity, 1) + 1  # Plus the NIL sentinel
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._links = np.zeros((capacity, 3), dtype=np.int32)
+        self._color = np.zeros(capacity, dtype=np.uint8)  # NIL is black
+        # Stack of free slots; lowest indices are handed out first
+        self._free = np.arange(capacity - 1, NIL, -1, dtype=np.int32)
+        self._top = capacity - 1
+        self.root = NIL
+
+    def _grow(self):
+        """Double the number of node slots and push the new slots as free."""
+        old = len(self._keys)
+        new = old * 2
+
+        def extend(array):
+            grown = np.zeros((new,) + array.shape[1:], dtype=array.dtype)
+            grown[:old] = array
+            return grown
+
+        self._keys = extend(self._keys)
+        self._links = extend(self._links)
+        self._color = extend(self._color)
+
+        free = np.empty(new, dtype=np.int32)
+        free[:self._top] = self._free[:self._top]
+        added = new - old
+        free[self._top:self._top + added] = np.arange(new - 1, old - 1, -1, dtype=np.int32)
+        self._free = free
+        self._top += added
+
+
+_INT64 = np.iinfo(np.int64)
+
+
+def _check_key(data):
+    """Raise unless data can be stored as an int64 key without conversion.
+
+    Without this check a float would be truncated when stored (so inserting
+    1.5 would make read(1) succeed) and trigger a separate compilation of
+    every kernel for float arguments. Booleans are rejected too, although
+    bool is a subclass of int, to match the batch check of bool arrays.
+    """
+    if isinstance(data, bool) or not isinstance(data, (int, np.integer)):
+        raise TypeError(f"Keys must be integers, not {type(data).__name__}")
+    if not _INT64.min <= data <= _INT64.max:
+        raise OverflowError("Key does not fit in a signed 64-bit integer")
+
+
+def _check_keys(values):
+    """Return values as an int64 array, raising like _check_key on bad input.
+
+    Arrays are checked by dtype. Anything else is checked value by value
+    rather than through NumPy's type inference, which would turn ints just
+    above the int64 range into uint64 (wrapping around when cast) and mixes
+    such as a uint64 with an int into float64.
+    """
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+        for value in values:
+            _check_key(value)
+        return np.array(values, dtype=np.int64)
+    kind = values.dtype.kind
+    if kind == 'O':
+        for value in values.flat:
+            _check_key(value)
+    elif kind == 'u':
+        if values.size and values.max() > _INT64.max:
+            raise OverflowError("Key does not fit in a signed 64-bit integer")
+    elif kind != 'i' and values.size:
+        raise TypeError(f"Keys must be integers, not {values.dtype}")
+    return values.astype(np.int64)
+
+
+class RedBlackTreeInt(NumbaRedBlackTree):
+    """NumbaRedBlackTree that validates every key before it reaches compiled code.
+
+    Use it in place of ``RedBlackTree`` when all data are integers: the
+    operations run in the Numba kernels, and anything that is not an int64
+    is rejected with the same kind of error Python would raise instead of
+    being silently converted.
+    """
+
+    def insert(self, data):
+        """Insert a new node with the given data.
+
+        Args:
+            data (int): The data to be inserted
+
+        Raises:
+            TypeError: If data is not an integer
+            OverflowError: If data does not fit in 64 bits
+        """
+        _check_key(data)
+        super().insert(data)
+
+    def read(self, data):
+        """Search for a node with the given data.
+
+        Args:
+            data (int): The data to search for
+
+        Returns:
+            bool: True if data exists in tree, False otherwise
+
+        Raises:
+            TypeError: If data is not an integer
+            OverflowError: If data does not fit in 64 bits
+        """
+        _check_key(data)
+        return super().read(data)
+
+    def delete(self, data):
+        """Delete the node with the given data.
+
+        Args:
+            data (int): The data to be deleted
+
+        Raises:
+            ValueError: If data not found in tree
+            TypeError: If data is not an integer
+            OverflowError: If data does not fit in 64 bits
+        """
+        _check_key(data)
+        super().delete(data)
+
+    def insert_many(self, values):
+        """Insert every value, in order, in one compiled call.
+
+        Args:
+            values (array-like of int): Values to insert
+
+        Raises:
+            TypeError: If values are not integers
+            OverflowError: If a value does not fit in 64 bits
+        """
+        super().insert_many(_check_keys(values))
+
+    def bulk_load(self, values):
+        """Build the tree from a collection of values in one pass.
+
+        Args:
+            values (array-like of int): Values to load
+
+        Raises:
+            TypeError: If values are not integers
+            OverflowError: If a value does not fit in 64 bits
+        """
+        super().bulk_load(_check_keys(values))
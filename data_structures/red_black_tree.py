@@ -15,19 +15,49 @@ class Node:
     
     Attributes:
         data: The data stored in the node
+        count (int): Number of times data has been inserted
         color (bool): True for Red, False for Black
         left (Node): Left child
         right (Node): Right child
         parent (Node): Parent node
     """
     
+    __slots__ = ('data', 'count', 'color', 'left', 'right', 'parent')
+    
     def __init__(self, data):
         self.data = data
+        self.count = 1
         self.color = True  # New nodes are red by default
         self.left = None
         self.right = None
         self.parent = None
 
+class _NilNode(Node):
+    """Type of the NIL sentinel.
+    
+    Copying or unpickling a tree must keep pointing at the one module-level
+    sentinel, since every NIL check is by identity, so copies of it resolve
+    to the global instead of creating a new node.
+    """
+    
+    __slots__ = ()
+    
+    def __reduce__(self):
+        return '_NIL'
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+
+# Sentinel standing in for every leaf. It is shared by all trees, so nodes can
+# be checked against it by identity. Deletion temporarily sets its parent,
+# which is only read within that same deletion.
+_NIL = _NilNode(None)
+_NIL.color = False  # NIL nodes are black
+_NIL.left = _NIL.right = _NIL.parent = _NIL
+
 class RedBlackTree:
     """Red-Black Tree implementation with standard operations.
     
@@ -36,35 +66,44 @@ class RedBlackTree:
     
     def __init__(self):
         """Initialize an empty Red-Black Tree."""
-        self.NIL = Node(None)  # Sentinel node
-        self.NIL.color = False  # NIL nodes are black
-        self.root = self.NIL
+        self.NIL = _NIL  # Sentinel node, shared by all trees
+        self.root = _NIL
+        self._free = []  # Deleted nodes available for reuse
     
     def insert(self, data):
         """Insert a new node with the given data.
         
+        Inserting data that is already in the tree only increments the
+        existing node's count, so duplicates don't lengthen search paths.
+        
         Args:
             data: The data to be inserted
         """
-        node = Node(data)
-        node.left = self.NIL
-        node.right = self.NIL
-        
         y = None
         x = self.root
         
         # Find the position to insert
-        while x != self.NIL:
+        while x is not _NIL:
             y = x
-            if node.data < x.data:
-                x = x.left
-            else:
-                x = x.right
+            d = x.data
+            if data == d:
+                x.count += 1
+                return
+            x = x.left if data < d else x.right
         
+        if self._free:
+            node = self._free.pop()
+            node.data = data
+            node.count = 1
+            node.color = True
+        else:
+            node = Node(data)
+        node.left = _NIL
+        node.right = _NIL
         node.parent = y
         if y is None:
             self.root = node  # Tree was empty
-        elif node.data < y.data:
+        elif data < y.data:
             y.left = node
         else:
             y.right = node
@@ -81,18 +120,19 @@ class RedBlackTree:
             bool: True if data exists in tree, False otherwise
         """
         node = self.root
-        while node != self.NIL:
-            if data == node.data:
+        while node is not _NIL:
+            d = node.data
+            if data == d:
                 return True
-            elif data < node.data:
-                node = node.left
-            else:
-                node = node.right
+            node = node.left if data < d else node.right
         return False
     
     def delete(self, data):
         """Delete the node with the given data.
         
+        Data inserted several times has to be deleted as many times before
+        its node is removed.
+        
         Args:
             data: The data to be deleted
             
@@ -100,17 +140,74 @@ class RedBlackTree:
             ValueError: If data not found in tree
         """
         z = self._find_node(data)
-        if z:
-            self._delete_node(z)
-        else:
+        if z is None:
             raise ValueError("Data not found in tree")
+        if z.count > 1:
+            z.count -= 1
+        else:
+            self._delete_node(z)
+    
+    def bulk_load(self, values):
+        """Build the tree from a collection of values in one pass.
+        
+        The values are sorted once and the middle element of every range
+        becomes the root of its subtree, which gives a perfectly balanced
+        tree. All levels but the deepest are complete, so coloring the
+        deepest level red and everything else black satisfies the
+        Red-Black properties without any rotations or insert fixups. This
+        runs in O(n log n) for the sort plus O(n) for the build. Replaces
+        the current contents.
+        
+        Args:
+            values (iterable): Values to load
+        """
+        # Collapse repeated values into one node each, as insert does
+        unique = []
+        counts = []
+        for value in sorted(values):
+            if unique and value == unique[-1]:
+                counts[-1] += 1
+            else:
+                unique.append(value)
+                counts.append(1)
+        
+        # Depth of the deepest level; only that level can be incomplete
+        red_depth = len(unique).bit_length() - 1
+        self.root = self._build_subtree(unique, counts, 0, len(unique), None, 0, red_depth)
+        self.root.color = False  # Root must be black
     
     # Private methods
     
+    def _build_subtree(self, values, counts, lo, hi, parent, depth, red_depth):
+        """Build a balanced subtree from the sorted slice values[lo:hi].
+        
+        Args:
+            values (list): Sorted distinct values
+            counts (list): Number of occurrences of each value
+            lo (int): Start of the slice
+            hi (int): End of the slice (exclusive)
+            parent (Node): Parent of the subtree root, or None for the root
+            depth (int): Depth of the subtree root
+            red_depth (int): Depth whose nodes are colored red
+            
+        Returns:
+            Node: Root of the subtree, or NIL for an empty slice
+        """
+        if lo >= hi:
+            return _NIL
+        mid = (lo + hi) // 2
+        node = Node(values[mid])
+        node.count = counts[mid]
+        node.color = depth == red_depth
+        node.parent = parent
+        node.left = self._build_subtree(values, counts, lo, mid, node, depth + 1, red_depth)
+        node.right = self._build_subtree(values, counts, mid + 1, hi, node, depth + 1, red_depth)
+        return node
+    
     def _fix_insert(self, k):
         """Fix the Red-Black Tree properties after insertion."""
         while k.parent and k.parent.color:  # While parent is red
-            if k.parent == k.parent.parent.right:  # Parent is right child
+            if k.parent is k.parent.parent.right:  # Parent is right child
                 u = k.parent.parent.left  # Uncle
                 if u.color:  # Uncle is red
                     u.color = False
@@ -118,7 +215,7 @@ class RedBlackTree:
                     k.parent.parent.color = True
                     k = k.parent.parent
                 else:  # Uncle is black
-                    if k == k.parent.left:  # k is left child
+                    if k is k.parent.left:  # k is left child
                         k = k.parent
                         self._right_rotate(k)
                     k.parent.color = False
@@ -132,13 +229,13 @@ class RedBlackTree:
                     k.parent.parent.color = True
                     k = k.parent.parent
                 else:  # Uncle is black
-                    if k == k.parent.right:  # k is right child
+                    if k is k.parent.right:  # k is right child
                         k = k.parent
                         self._left_rotate(k)
                     k.parent.color = False
                     k.parent.parent.color = True
                     self._right_rotate(k.parent.parent)
-            if k == self.root:
+            if k is self.root:
                 break
         self.root.color = False  # Root must be black
     
@@ -146,12 +243,12 @@ class RedBlackTree:
         """Perform left rotation on the given node."""
         y = x.right
         x.right = y.left
-        if y.left != self.NIL:
+        if y.left is not _NIL:
             y.left.parent = x
         y.parent = x.parent
         if x.parent is None:
             self.root = y
-        elif x == x.parent.left:
+        elif x is x.parent.left:
             x.parent.left = y
         else:
             x.parent.right = y
@@ -162,12 +259,12 @@ class RedBlackTree:
         """Perform right rotation on the given node."""
         y = x.left
         x.left = y.right
-        if y.right != self.NIL:
+        if y.right is not _NIL:
             y.right.parent = x
         y.parent = x.parent
         if x.parent is None:
             self.root = y
-        elif x == x.parent.right:
+        elif x is x.parent.right:
             x.parent.right = y
         else:
             x.parent.left = y
@@ -177,59 +274,77 @@ class RedBlackTree:
     def _find_node(self, data):
         """Find and return the node with the given data."""
         node = self.root
-        while node != self.NIL:
-            if data == node.data:
+        while node is not _NIL:
+            d = node.data
+            if data == d:
                 return node
-            elif data < node.data:
-                node = node.left
-            else:
-                node = node.right
+            node = node.left if data < d else node.right
         return None
     
     def _delete_node(self, z):
-        """Delete the given node and fix the tree properties."""
-        y = z
-        y_original_color = y.color
+        """Delete the given node and fix the tree properties.
         
-        if z.left == self.NIL:
-            x = z.right
-            self._transplant(z, z.right)
-        elif z.right == self.NIL:
-            x = z.left
-            self._transplant(z, z.left)
+        Subtree replacements are written out inline rather than through a
+        helper, which saves up to three method calls per deletion.
+        """
+        left = z.left
+        right = z.right
+        if left is _NIL or right is _NIL:
+            # At most one child: it takes z's place
+            x = right if left is _NIL else left
+            replacement = x
+            y_original_color = z.color
         else:
-            y = self._minimum(z.right)
+            # Two children: z's successor y takes z's place
+            y = self._minimum(right)
             y_original_color = y.color
             x = y.right
-            if y.parent == z:
+            if y.parent is z:
                 x.parent = y
             else:
-                self._transplant(y, y.right)
-                y.right = z.right
-                y.right.parent = y
-            self._transplant(z, y)
-            y.left = z.left
-            y.left.parent = y
+                # y is the leftmost node of z's right subtree, so it is a
+                # left child; its right subtree moves up into its place
+                y_parent = y.parent
+                y_parent.left = x
+                x.parent = y_parent
+                y.right = right
+                right.parent = y
+            y.left = left
+            left.parent = y
             y.color = z.color
+            replacement = y
+        
+        parent = z.parent
+        if parent is None:
+            self.root = replacement
+        elif z is parent.left:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        replacement.parent = parent
             
-        if y_original_color == False:
+        if not y_original_color:
             self._fix_delete(x)
+        
+        # z is unlinked now; drop its references and keep it for reuse
+        z.data = z.left = z.right = z.parent = None
+        self._free.append(z)
     
     def _fix_delete(self, x):
         """Fix the Red-Black Tree properties after deletion."""
-        while x != self.root and x.color == False:
-            if x == x.parent.left:
+        while x is not self.root and not x.color:
+            if x is x.parent.left:
                 w = x.parent.right
-                if w.color == True:
+                if w.color:
                     w.color = False
                     x.parent.color = True
                     self._left_rotate(x.parent)
                     w = x.parent.right
-                if w.left.color == False and w.right.color == False:
+                if not w.left.color and not w.right.color:
                     w.color = True
                     x = x.parent
                 else:
-                    if w.right.color == False:
+                    if not w.right.color:
                         w.left.color = False
                         w.color = True
                         self._right_rotate(w)
@@ -241,16 +356,16 @@ class RedBlackTree:
                     x = self.root
             else:
                 w = x.parent.left
-                if w.color == True:
+                if w.color:
                     w.color = False
                     x.parent.color = True
                     self._right_rotate(x.parent)
                     w = x.parent.left
-                if w.right.color == False and w.left.color == False:
+                if not w.right.color and not w.left.color:
                     w.color = True
                     x = x.parent
                 else:
-                    if w.left.color == False:
+                    if not w.left.color:
                         w.right.color = False
                         w.color = True
                         self._left_rotate(w)
@@ -262,18 +377,8 @@ class RedBlackTree:
                     x = self.root
         x.color = False
     
-    def _transplant(self, u, v):
-        """Replace subtree rooted at u with subtree rooted at v."""
-        if u.parent is None:
-            self.root = v
-        elif u == u.parent.left:
-            u.parent.left = v
-        else:
-            u.parent.right = v
-        v.parent = u.parent
-    
     def _minimum(self, node):
         """Find the minimum value in the subtree rooted at node."""
-        while node.left != self.NIL:
+        while node.left is not _NIL:
             node = node.left
         return node
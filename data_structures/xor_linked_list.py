@@ -8,8 +8,6 @@ doubly linked list.
 Note: This implementation requires careful memory management and pointer manipulation.
 """
 
-import ctypes
-
 class Node:
     """A node in the XOR Linked List.
     
@@ -18,6 +16,8 @@ class Node:
         npx (int): XOR of addresses of previous and next nodes
     """
     
+    __slots__ = ('data', 'npx')
+    
     def __init__(self, data):
         """Initialize a new node with the given data.
         
@@ -34,7 +34,7 @@ class XORLinkedList:
         """Initialize an empty XOR linked list."""
         self.head = None
         self.tail = None
-        self._nodes = []  # Keep references to prevent garbage collection
+        self._nodes = {}  # id -> node, keeps nodes from being garbage collected
     
     def _get_ptr(self, node):
         """Get the memory address of a node.
@@ -56,7 +56,9 @@ class XORLinkedList:
         Returns:
             Node: The node at the given address
         """
-        return ctypes.cast(ptr, ctypes.py_object).value if ptr else None
+        # Every live node is registered under its address, so a dict probe
+        # resolves it without dereferencing the raw pointer through ctypes
+        return self._nodes.get(ptr) if ptr else None
     
     def insert(self, data, position=None):
         """Insert a new node with the given data.
@@ -72,7 +74,7 @@ class XORLinkedList:
             IndexError: If position is out of range
         """
         new_node = Node(data)
-        self._nodes.append(new_node)  # Prevent garbage collection
+        self._nodes[id(new_node)] = new_node  # Prevent garbage collection
         
         if not self.head:  # Empty list
             self.head = new_node
@@ -169,15 +171,17 @@ class XORLinkedList:
             raise IndexError("List is empty")
             
         if position == 0:  # Delete head
-            data = self.head.data
-            next_ptr = self.head.npx
+            head = self.head
+            data = head.data
+            next_ptr = head.npx
             if next_ptr:  # More than one node
                 next_node = self._get_node(next_ptr)
-                next_node.npx = next_node.npx ^ self._get_ptr(self.head)
+                next_node.npx = next_node.npx ^ self._get_ptr(head)
                 self.head = next_node
             else:  # Only one node
                 self.head = None
                 self.tail = None
+            del self._nodes[id(head)]
             return data
             
         # Find node to delete
@@ -216,6 +220,6 @@ class XORLinkedList:
         if current == self.tail:
             self.tail = self._get_node(prev_ptr)
             
-        # Remove from reference list to allow garbage collection
-        self._nodes.remove(current)
+        # Drop our reference to allow garbage collection
+        del self._nodes[id(current)]
         return current.data
@@ -1,3 +1,4 @@
+import random
 import unittest
 from data_structures.b_tree import BTree
 
@@ -13,6 +14,28 @@ class TestBTree(unittest.TestCase):
             self.tree.insert(value)
             self.assertTrue(self.tree.read(value))
 
+    def test_insert_many(self):
+        """Test that keys survive the node splits of a deeper tree."""
+        values = [(i * 37) % 101 for i in range(101)]
+        for value in values:
+            self.tree.insert(value)
+        for value in values:
+            self.assertTrue(self.tree.read(value))
+
+    def test_insert_ascending(self):
+        """Test runs of neighbouring keys, which reuse the last leaf."""
+        tree = BTree(3, cache_leaf=True)
+        for value in range(200):
+            tree.insert(value)
+        for value in range(-1, 200, 3):
+            tree.insert(value)
+        for value in range(-1, 200):
+            self.assertTrue(tree.read(value))
+        self.assertFalse(tree.read(200))
+        tree.delete(100)
+        tree.insert(100)
+        self.assertTrue(tree.read(100))
+
     def test_delete(self):
         """Test deletion operation."""
         # Insert fewer values to reduce complexity
@@ -27,6 +50,77 @@ class TestBTree(unittest.TestCase):
         self.assertTrue(self.tree.read(10))
         self.assertTrue(self.tree.read(30))
 
+    def test_delete_all(self):
+        """Test deleting every key from a multi-level tree."""
+        values = [(i * 37) % 101 for i in range(101)]
+        for value in values:
+            self.tree.insert(value)
+
+        for value in sorted(values):
+            self.tree.delete(value)
+            self.assertFalse(self.tree.read(value))
+        self.assertTrue(self.tree.root.leaf)
+
+    def test_delete_without_rebalance(self):
+        """Test deleting every key without rebalancing nodes."""
+        values = [(i * 37) % 101 for i in range(101)]
+        for value in values:
+            self.tree.insert(value)
+
+        for value in sorted(values):
+            self.tree.delete(value, rebalance=False)
+            self.assertFalse(self.tree.read(value))
+            if value < 100:
+                self.assertTrue(self.tree.read(100))
+        with self.assertRaises(ValueError):
+            self.tree.delete(100, rebalance=False)
+
+    def test_delete_mixed_rebalance(self):
+        """Test balanced operations after deletes without rebalancing."""
+        values = list(range(200))
+        random.Random(3).shuffle(values)
+        for value in values:
+            self.tree.insert(value)
+
+        # Leave the tree with underfull nodes and pruned subtrees
+        for value in values[:150]:
+            self.tree.delete(value, rebalance=False)
+        remaining = set(values[150:])
+
+        rnd = random.Random(4)
+        for step in range(300):
+            if rnd.random() < 0.5 or not remaining:
+                value = 200 + step  # Not in the tree yet
+                self.tree.insert(value)
+                remaining.add(value)
+            else:
+                value = rnd.choice(sorted(remaining))
+                self.tree.delete(value, rebalance=step % 4 == 0)
+                remaining.discard(value)
+        for value in range(500):
+            self.assertEqual(self.tree.read(value), value in remaining)
+
+        # A balanced delete leaves the tree meeting the B-tree properties
+        self.tree.delete(min(remaining))
+        remaining.discard(min(remaining))
+        depths = set()
+        stack = [(self.tree.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is not self.tree.root:
+                self.assertGreaterEqual(len(node.keys), self.tree.t - 1)
+            if node.leaf:
+                depths.add(depth)
+            else:
+                self.assertEqual(len(node.children), len(node.keys) + 1)
+                stack.extend((child, depth + 1) for child in node.children)
+        self.assertEqual(len(depths), 1)
+
+        for value in sorted(remaining):
+            self.tree.delete(value)
+        self.assertTrue(self.tree.root.leaf)
+        self.assertEqual(len(self.tree.root.keys), 0)
+
     def test_delete_nonexistent(self):
         """Test deleting a value that doesn't exist."""
         self.tree.insert(5)
@@ -37,5 +131,56 @@ class TestBTree(unittest.TestCase):
         """Test reading from an empty tree."""
         self.assertFalse(self.tree.read(5))
 
+    def test_bulk_load(self):
+        """Test building the tree from a batch of unsorted keys."""
+        values = [(i * 37) % 101 for i in range(101)]
+        self.tree.bulk_load(values)
+        for value in values:
+            self.assertTrue(self.tree.read(value))
+        self.assertFalse(self.tree.read(101))
+
+    def test_array_keys(self):
+        """Test a tree that stores its keys in int64 arrays."""
+        tree = BTree(3, typecode='q')
+        values = [(i * 37) % 101 for i in range(101)]
+        for value in values:
+            tree.insert(value)
+        self.assertEqual(tree.root.keys.typecode, 'q')
+
+        for value in sorted(values):
+            self.assertTrue(tree.read(value))
+            tree.delete(value)
+            self.assertFalse(tree.read(value))
+
+        tree.bulk_load(values)
+        for value in values:
+            self.assertTrue(tree.read(value))
+
+    def test_delete_wide_nodes(self):
+        """Test deletes at a degree where siblings lend several keys at once."""
+        values = list(range(2000))
+        for order in ('random', 'sorted'):
+            for tree in (BTree(16), BTree(16, typecode='q')):
+                shuffled = values[:]
+                random.Random(7).shuffle(shuffled)
+                for value in shuffled:
+                    tree.insert(value)
+                self.assertFalse(tree.root.leaf)
+
+                delete_order = shuffled if order == 'random' else values
+                remaining = set(values)
+                for step, value in enumerate(delete_order):
+                    tree.delete(value)
+                    remaining.discard(value)
+                    self.assertFalse(tree.read(value))
+                    # Spot-check survivors on both sides of the deleted key
+                    for other in (value - 37, value + 1, value + 211):
+                        if 0 <= other < 2000:
+                            self.assertEqual(tree.read(other), other in remaining)
+                    if step % 250 == 0:
+                        for other in remaining:
+                            self.assertTrue(tree.read(other))
+                self.assertTrue(tree.root.leaf)
+
 if __name__ == '__main__':
     unittest.main()
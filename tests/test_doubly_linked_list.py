@@ -0,0 +1,62 @@
+import unittest
+from data_structures.doubly_linked_list import DoublyLinkedList
+from test_xor_linked_list import LinkedListTests
+
+class TestDoublyLinkedList(LinkedListTests, unittest.TestCase):
+    list_class = DoublyLinkedList
+
+    def test_matches_python_list(self):
+        """Test a mix of positional operations against a plain list."""
+        expected = []
+        for value in range(20):
+            self.list.insert(value)
+            expected.append(value)
+        for value, position in [(20, 0), (21, 5), (22, 19), (23, 11)]:
+            self.list.insert(value, position)
+            expected.insert(position, value)
+        for position in [0, 3, 20, 12, 0]:
+            self.assertEqual(self.list.delete(position), expected.pop(position))
+        for value in range(24, 28):
+            self.list.insert(value, 2)
+            expected.insert(2, value)
+
+        for position, value in enumerate(expected):
+            self.assertEqual(self.list.read(position), value)
+        self.assertEqual(self.list.tail.data, expected[-1])
+
+    def test_walks_from_nearer_end(self):
+        """Test positions on both sides of the middle, and the ends."""
+        for value in range(11):
+            self.list.insert(value)
+        for position in range(11):
+            self.assertEqual(self.list.read(position), position)
+        self.assertIs(self.list._node_at(10), self.list.tail)
+        self.assertIs(self.list._node_at(0), self.list.head)
+        self.assertEqual(self.list.delete(9), 9)
+        self.assertEqual(self.list.read(9), 10)
+
+    def test_reuses_deleted_nodes(self):
+        """Test that deleted nodes go on the free list and are reused."""
+        for value in range(3):
+            self.list.insert(value)
+        node = self.list._node_at(1)
+        self.list.delete(1)
+        self.assertEqual(self.list._free, [node])
+        self.assertIsNone(node.data)
+
+        self.list.insert(5, 1)
+        self.assertEqual(self.list._free, [])
+        self.assertIs(self.list._node_at(1), node)
+        self.assertEqual([self.list.read(i) for i in range(3)], [0, 5, 2])
+
+    def test_reserve(self):
+        """Test that reserved nodes are used by later inserts."""
+        self.list.reserve(10)
+        for value in range(10):
+            self.list.insert(value, 0)
+        self.assertEqual(self.list._free, [])
+        for position in range(10):
+            self.assertEqual(self.list.read(position), 9 - position)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from data_structures.numba_b_tree import NumbaBTree
+
+class TestNumbaBTree(unittest.TestCase):
+    def setUp(self):
+        """Set up a new B-tree before each test."""
+        self.tree = NumbaBTree(3)  # Minimum degree 3
+
+    def test_insert_and_read(self):
+        """Test basic insertion and reading operations."""
+        values = [10, 20, 5, 6, 12, 30, 7, 17]
+        for value in values:
+            self.tree.insert(value)
+            self.assertTrue(self.tree.read(value))
+
+    def test_delete(self):
+        """Test deletion operation."""
+        values = [10, 20, 30]
+        for value in values:
+            self.tree.insert(value)
+            self.assertTrue(self.tree.read(value))
+
+        # Delete middle value
+        self.tree.delete(20)
+        self.assertFalse(self.tree.read(20))
+        self.assertTrue(self.tree.read(10))
+        self.assertTrue(self.tree.read(30))
+
+    def test_key_rows_line_aligned(self):
+        """Test that every key row starts on a cache-line boundary."""
+        for t in (2, 3, 5, 16, 17):
+            tree = NumbaBTree(t)
+            keys = tree._keys
+            self.assertGreaterEqual(keys.shape[1], 2 * t - 1)
+            self.assertEqual(keys.ctypes.data % 64, 0)
+            self.assertEqual(keys.strides[0] % 64, 0)
+
+    def test_delete_nonexistent(self):
+        """Test deleting a value that doesn't exist."""
+        self.tree.insert(5)
+        with self.assertRaises(ValueError):
+            self.tree.delete(10)
+
+    def test_read_empty_tree(self):
+        """Test reading from an empty tree."""
+        self.assertFalse(self.tree.read(5))
+
+    def test_grow_and_delete_all(self):
+        """Test that node storage grows and every key can be deleted again."""
+        tree = NumbaBTree(2, capacity=1)
+        values = [(i * 7919) % 1000 for i in range(1000)]
+        for value in values:
+            tree.insert(value)
+
+        for value in sorted(values):
+            self.assertTrue(tree.read(value))
+            tree.delete(value)
+            self.assertFalse(tree.read(value))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import numpy as np
+from data_structures.numba_red_black_tree import NumbaRedBlackTree, RedBlackTreeInt
+
+class TestNumbaRedBlackTree(unittest.TestCase):
+    def setUp(self):
+        """Set up a new tree before each test."""
+        self.tree = NumbaRedBlackTree()
+
+    def test_insert_and_read(self):
+        """Test basic insertion and reading operations."""
+        values = [7, 3, 18, 10, 22, 8, 11, 26, 2, 6]
+        for value in values:
+            self.tree.insert(value)
+            self.assertTrue(self.tree.read(value))
+
+    def test_delete(self):
+        """Test deletion operation."""
+        values = [7, 3, 18, 10, 22]
+        for value in values:
+            self.tree.insert(value)
+
+        self.tree.delete(18)
+        self.assertFalse(self.tree.read(18))
+        self.assertTrue(self.tree.read(7))
+        self.assertTrue(self.tree.read(22))
+
+    def test_delete_nonexistent(self):
+        """Test deleting a value that doesn't exist."""
+        self.tree.insert(5)
+        with self.assertRaises(ValueError):
+            self.tree.delete(10)
+
+    def test_read_empty_tree(self):
+        """Test reading from an empty tree."""
+        self.assertFalse(self.tree.read(5))
+
+    def test_grow_and_delete_all(self):
+        """Test that node storage grows and every key can be deleted again."""
+        tree = NumbaRedBlackTree(capacity=1)
+        values = [(i * 7919) % 1000 for i in range(1000)]
+        for value in values:
+            tree.insert(value)
+
+        for value in sorted(values):
+            self.assertTrue(tree.read(value))
+            tree.delete(value)
+            self.assertFalse(tree.read(value))
+
+    def test_bulk_load(self):
+        """Test loading a batch of values in one call."""
+        values = [(i * 37) % 101 for i in range(101)]
+        self.tree.insert(500)
+        self.tree.bulk_load(values)
+        for value in values:
+            self.assertTrue(self.tree.read(value))
+        self.assertFalse(self.tree.read(500))
+
+        for value in values:
+            self.tree.delete(value)
+        self.assertFalse(self.tree.read(0))
+
+    def test_insert_many(self):
+        """Test inserting a batch of values in one call."""
+        tree = NumbaRedBlackTree(capacity=1)
+        tree.insert(500)
+        values = [(i * 37) % 101 for i in range(101)]
+        tree.insert_many(values)
+        for value in values + [500]:
+            self.assertTrue(tree.read(value))
+
+        for value in values + [500]:
+            tree.delete(value)
+            self.assertFalse(tree.read(value))
+
+class TestRedBlackTreeInt(unittest.TestCase):
+    def setUp(self):
+        """Set up a new tree before each test."""
+        self.tree = RedBlackTreeInt()
+
+    def test_insert_read_delete(self):
+        """Test that integer keys work like in the unchecked tree."""
+        for value in [7, 3, 18, -10]:
+            self.tree.insert(value)
+        self.tree.delete(3)
+        self.assertFalse(self.tree.read(3))
+        self.assertTrue(self.tree.read(-10))
+
+    def test_rejects_non_integers(self):
+        """Test that keys which would be converted are rejected."""
+        with self.assertRaises(TypeError):
+            self.tree.insert(1.5)
+        with self.assertRaises(TypeError):
+            self.tree.read('3')
+        with self.assertRaises(OverflowError):
+            self.tree.insert(2 ** 63)
+        with self.assertRaises(TypeError):
+            self.tree.bulk_load([1.0, 2.0])
+        with self.assertRaises(OverflowError):
+            self.tree.bulk_load([2 ** 63])  # Inferred as uint64
+        with self.assertRaises(OverflowError):
+            self.tree.bulk_load([1, 2 ** 64])  # Inferred as object
+        with self.assertRaises(OverflowError):
+            self.tree.bulk_load(np.array([2 ** 63], dtype=np.uint64))
+        with self.assertRaises(OverflowError):
+            self.tree.insert_many(np.array([2 ** 63], dtype=np.uint64))
+        with self.assertRaises(TypeError):
+            self.tree.insert_many([1, 2.5])
+        self.assertFalse(self.tree.read(1))
+        self.assertFalse(self.tree.read(-2 ** 63))
+
+    def test_rejects_booleans(self):
+        """Test that booleans are rejected one at a time and in batches."""
+        with self.assertRaises(TypeError):
+            self.tree.insert(True)
+        with self.assertRaises(TypeError):
+            self.tree.insert(np.bool_(False))
+        with self.assertRaises(TypeError):
+            self.tree.bulk_load([1, True])
+        with self.assertRaises(TypeError):
+            self.tree.bulk_load(np.array([True, False]))
+        with self.assertRaises(TypeError):
+            self.tree.insert_many(np.array([True]))
+        self.assertFalse(self.tree.read(1))
+
+if __name__ == '__main__':
+    unittest.main()
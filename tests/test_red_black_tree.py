@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 from data_structures.red_black_tree import RedBlackTree
 
@@ -30,9 +32,70 @@ class TestRedBlackTree(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tree.delete(10)
 
+    def test_duplicates(self):
+        """Test that repeated data needs as many deletes as inserts."""
+        for value in [5, 3, 5, 8, 5]:
+            self.tree.insert(value)
+
+        self.tree.delete(5)
+        self.tree.delete(5)
+        self.assertTrue(self.tree.read(5))
+        self.tree.delete(5)
+        self.assertFalse(self.tree.read(5))
+        with self.assertRaises(ValueError):
+            self.tree.delete(5)
+        self.assertTrue(self.tree.read(3))
+        self.assertTrue(self.tree.read(8))
+
     def test_read_empty_tree(self):
         """Test reading from an empty tree."""
         self.assertFalse(self.tree.read(5))
 
+    def test_bulk_load(self):
+        """Test building the tree from a batch of unsorted values."""
+        values = [(i * 37) % 101 for i in range(101)]
+        self.tree.bulk_load(values)
+        for value in values:
+            self.assertTrue(self.tree.read(value))
+        self.assertFalse(self.tree.read(101))
+
+        # The loaded tree keeps working with regular updates
+        self.tree.insert(101)
+        for value in values:
+            self.tree.delete(value)
+        self.assertTrue(self.tree.read(101))
+
+    def test_independent_trees(self):
+        """Test that trees sharing the NIL sentinel don't affect each other."""
+        other = RedBlackTree()
+        for value in range(50):
+            self.tree.insert(value)
+            other.insert(-value)
+        for value in range(0, 50, 2):
+            self.tree.delete(value)
+            other.delete(-value - 1)
+
+        for value in range(50):
+            self.assertEqual(self.tree.read(value), value % 2 == 1)
+            self.assertEqual(other.read(-value), value % 2 == 0)
+
+    def test_copy_and_pickle(self):
+        """Test that copied and unpickled trees still find the NIL sentinel."""
+        for value in [7, 3, 18, 10, 22]:
+            self.tree.insert(value)
+
+        copies = [copy.deepcopy(self.tree), pickle.loads(pickle.dumps(self.tree))]
+        for tree in copies:
+            self.assertTrue(tree.read(10))
+            self.assertFalse(tree.read(4))
+            self.assertFalse(tree.read(30))
+            tree.delete(18)
+            self.assertFalse(tree.read(18))
+            with self.assertRaises(ValueError):
+                tree.delete(4)
+            tree.insert(4)
+            self.assertTrue(tree.read(4))
+        self.assertTrue(self.tree.read(18))
+
 if __name__ == '__main__':
     unittest.main()
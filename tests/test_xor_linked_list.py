@@ -1,10 +1,17 @@
 import unittest
 from data_structures.xor_linked_list import XORLinkedList
 
-class TestXORLinkedList(unittest.TestCase):
+class LinkedListTests:
+    """Interface tests shared by every positional list.
+
+    Subclasses mix this into a unittest.TestCase and set list_class.
+    """
+
+    list_class = None
+
     def setUp(self):
         """Set up a new list before each test."""
-        self.list = XORLinkedList()
+        self.list = self.list_class()
 
     def test_insert_and_read(self):
         """Test insertion at different positions and reading."""
@@ -55,5 +62,8 @@ class TestXORLinkedList(unittest.TestCase):
         with self.assertRaises(IndexError):
             self.list.insert(2, 2)
 
+class TestXORLinkedList(LinkedListTests, unittest.TestCase):
+    list_class = XORLinkedList
+
 if __name__ == '__main__':
     unittest.main()